@@ -29,14 +29,11 @@ import logging
 from asyncio import create_task as asyncio_create_task
 from asyncio import sleep as asyncio_sleep
 
-# Collections Data Types Library
-from collections import OrderedDict
-
 # JSON Library
 from json import dumps as json_dumps
 
 # Operating System Library
-from os import path, remove, makedirs, listdir
+from os import path, remove, makedirs
 
 # Random Library
 from random import choice, randint
@@ -122,7 +119,7 @@ from constants import (
 )
 
 # Thread-Safe JSON Library
-from tsjson import TSjson
+from tsjson import TSjson, get_tsjson
 
 
 ###############################################################################
@@ -144,7 +141,6 @@ logger = logging.getLogger(__name__)
 class Globals():
     '''Global Elements Container.'''
 
-    files_config_list: list = []
     to_delete_in_time_messages_list: list = []
     new_users: dict = {}
     connections: dict = {}
@@ -172,26 +168,26 @@ def get_default_config_data():
     '''
     Get default config data structure.
     '''
-    config_data = OrderedDict([
-        ("Title", CONST["INIT_TITLE"]),
-        ("Link", CONST["INIT_LINK"]),
-        ("Language", CONST["INIT_LANG"]),
-        ("Enabled", CONST["INIT_ENABLE"]),
-        ("URL_Enabled", CONST["INIT_URL_ENABLE"]),
-        ("RM_All_Msg", CONST["INIT_RM_ALL_MSG"]),
-        ("Captcha_Chars_Mode", CONST["INIT_CAPTCHA_CHARS_MODE"]),
-        ("Captcha_Time", CONST["INIT_CAPTCHA_TIME"]),
-        ("Captcha_Difficulty_Level", CONST["INIT_CAPTCHA_DIFFICULTY_LEVEL"]),
-        ("Restrict_Non_Text", CONST["INIT_RESTRICT_NON_TEXT_MSG"]),
-        ("Rm_Result_Msg", CONST["INIT_RM_RESULT_MSG"]),
-        ("Rm_Welcome_Msg", CONST["INIT_RM_WELCOME_MSG"]),
-        ("Poll_Q", ""),
-        ("Poll_A", []),
-        ("Poll_C_A", 0),
-        ("Welcome_Msg", "-"),
-        ("Welcome_Time", CONST["T_DEL_WELCOME_MSG"]),
-        ("Ignore_List", [])
-    ])
+    config_data = {
+        "Title": CONST["INIT_TITLE"],
+        "Link": CONST["INIT_LINK"],
+        "Language": CONST["INIT_LANG"],
+        "Enabled": CONST["INIT_ENABLE"],
+        "URL_Enabled": CONST["INIT_URL_ENABLE"],
+        "RM_All_Msg": CONST["INIT_RM_ALL_MSG"],
+        "Captcha_Chars_Mode": CONST["INIT_CAPTCHA_CHARS_MODE"],
+        "Captcha_Time": CONST["INIT_CAPTCHA_TIME"],
+        "Captcha_Difficulty_Level": CONST["INIT_CAPTCHA_DIFFICULTY_LEVEL"],
+        "Restrict_Non_Text": CONST["INIT_RESTRICT_NON_TEXT_MSG"],
+        "Rm_Result_Msg": CONST["INIT_RM_RESULT_MSG"],
+        "Rm_Welcome_Msg": CONST["INIT_RM_WELCOME_MSG"],
+        "Poll_Q": "",
+        "Poll_A": [],
+        "Poll_C_A": 0,
+        "Welcome_Msg": "-",
+        "Welcome_Time": CONST["T_DEL_WELCOME_MSG"],
+        "Ignore_List": []
+    }
     # Feed Captcha Poll Options with empty answers for expected max num
     for _ in range(0, CONST["MAX_POLL_OPTIONS"]):
         config_data["Poll_A"].append("")
@@ -202,14 +198,28 @@ def save_config_property(chat_id, param, value):
     '''
     Store actual chat configuration in file.
     '''
+    save_config_properties(chat_id, {param: value})
+
+
+def save_config_properties(chat_id, properties):
+    '''
+    Store a group of chat configuration properties in file, reading
+    and writing the file just once for all of them.
+    '''
+    if not properties:
+        return
     fjson_config = get_chat_config_file(chat_id)
     config_data = fjson_config.read()
     if not config_data:
         config_data = get_default_config_data()
-    if (param in config_data) and (value == config_data[param]):
-        return
-    config_data[param] = value
-    fjson_config.write(config_data)
+    changed = False
+    for param, value in properties.items():
+        if (param in config_data) and (value == config_data[param]):
+            continue
+        config_data[param] = value
+        changed = True
+    if changed:
+        fjson_config.write(config_data)
 
 
 def get_chat_config(chat_id, param):
@@ -219,9 +229,13 @@ def get_chat_config(chat_id, param):
     file = get_chat_config_file(chat_id)
     if file:
         config_data = file.read()
-        if (not config_data) or (param not in config_data):
+        if not config_data:
             config_data = get_default_config_data()
-            save_config_property(chat_id, param, config_data[param])
+        elif param not in config_data:
+            # Store missing property from the already read data, instead
+            # of reading the file again through save_config_property()
+            config_data[param] = get_default_config_data()[param]
+            file.write(config_data)
     else:
         config_data = get_default_config_data()
         save_config_property(chat_id, param, config_data[param])
@@ -244,30 +258,12 @@ def get_all_chat_config(chat_id):
 
 def get_chat_config_file(chat_id):
     '''
-    Determine chat config file from the list by ID. Get the file if
-    exists or create it if not.
+    Get the chat config file by ID (shared TSjson instance of the chat
+    config file path).
     '''
-    file = OrderedDict([("ID", chat_id), ("File", None)])
-    found = False
-    if Global.files_config_list:
-        for chat_file in Global.files_config_list:
-            if chat_file["ID"] == chat_id:
-                file = chat_file
-                found = True
-                break
-        if not found:
-            chat_config_file_name = \
-                    f'{CONST["CHATS_DIR"]}/{chat_id}/{CONST["F_CONF"]}'
-            file["ID"] = chat_id
-            file["File"] = TSjson(chat_config_file_name)
-            Global.files_config_list.append(file)
-    else:
-        chat_config_file_name = \
-                f'{CONST["CHATS_DIR"]}/{chat_id}/{CONST["F_CONF"]}'
-        file["ID"] = chat_id
-        file["File"] = TSjson(chat_config_file_name)
-        Global.files_config_list.append(file)
-    return file["File"]
+    chat_config_file_name = \
+            f'{CONST["CHATS_DIR"]}/{chat_id}/{CONST["F_CONF"]}'
+    return get_tsjson(chat_config_file_name)
 
 
 ###############################################################################
@@ -327,12 +323,10 @@ def tlg_autodelete_msg(message, time_delete_sec=CONST["T_DEL_MSG"]):
     msg_id = message.message_id
     _t0 = time()
     # Add sent message data to to-delete messages list
-    sent_msg_data = OrderedDict(
-        [
-            ("Chat_id", None), ("User_id", None), ("Msg_id", None),
-            ("time", None), ("delete_time", None)
-        ]
-    )
+    sent_msg_data = {
+        "Chat_id": None, "User_id": None, "Msg_id": None,
+        "time": None, "delete_time": None
+    }
     sent_msg_data["Chat_id"] = chat_id
     sent_msg_data["User_id"] = user_id
     sent_msg_data["Msg_id"] = msg_id
@@ -420,20 +414,6 @@ def initialize_resources():
     # Create data directory if it does not exists
     if not path.exists(CONST["CHATS_DIR"]):
         makedirs(CONST["CHATS_DIR"])
-    else:
-        # If chats directory exists, check all subdirs names (chats ID)
-        files = listdir(CONST["CHATS_DIR"])
-        for f_chat_id in files:
-            # Populate config files list
-            file_path = f'{CONST["CHATS_DIR"]}/{f_chat_id}/{CONST["F_CONF"]}'
-            Global.files_config_list.append(
-                    OrderedDict(
-                            [("ID", f_chat_id), ("File", TSjson(file_path))]))
-            # Create default configuration file if it does not exists
-            if not path.exists(file_path):
-                default_conf = get_default_config_data()
-                for key, value in default_conf.items():
-                    save_config_property(f_chat_id, key, value)
     # Load and generate URL detector regex from TLD list file
     load_urls_regex(f'{SCRIPT_PATH}/{CONST["F_TLDS"]}')
     # Load all languages texts
@@ -864,13 +844,13 @@ async def chat_bot_status_change(
                 admin_language = language_code[0:2].upper()
             if admin_language not in TEXT:
                 admin_language = CONST["INIT_LANG"]
-            save_config_property(chat.id, "Language", admin_language)
             # Get and save chat data
+            chat_data = {"Language": admin_language}
             if chat.title:
-                save_config_property(chat.id, "Title", chat.title)
+                chat_data["Title"] = chat.title
             if chat.username:
-                chat_link = f"@{chat.username}"
-                save_config_property(chat.id, "Link", chat_link)
+                chat_data["Link"] = f"@{chat.username}"
+            save_config_properties(chat.id, chat_data)
             # Check if Group is not allowed to be used by the Bot
             if not await allowed_in_this_group(bot, chat, caused_by_user):
                 await tlg_leave_chat(bot, chat.id)
@@ -924,16 +904,18 @@ async def chat_member_status_change(
             "[%s] New join detected: %s (%s)",
             chat_id, join_user_name, join_user_id)
     # Get and update chat data
+    chat_data = {}
     chat_title = chat.title
     if chat_title:
-        save_config_property(chat_id, "Title", chat_title)
-    # Add an unicode Left to Right Mark (LRM) to chat title (fix for
-    # arabic, hebrew, etc.)
-    chat_title = add_lrm(chat_title)
+        chat_data["Title"] = chat_title
     chat_link = chat.username
     if chat_link:
         chat_link = f"@{chat_link}"
-        save_config_property(chat_id, "Link", chat_link)
+        chat_data["Link"] = chat_link
+    save_config_properties(chat_id, chat_data)
+    # Add an unicode Left to Right Mark (LRM) to chat title (fix for
+    # arabic, hebrew, etc.)
+    chat_title = add_lrm(chat_title)
     # Check if the Bot should manage a Captcha process to this Group
     # and Member
     if not await should_manage_captcha(update, bot):
@@ -1301,13 +1283,15 @@ async def text_msg_rx(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user_id = update_msg.from_user.id
     msg_id = update_msg.message_id
     # Get and update chat data
+    chat_data = {}
     chat_title = chat.title
     if chat_title:
-        save_config_property(chat_id, "Title", chat_title)
+        chat_data["Title"] = chat_title
     chat_link = chat.username
     if chat_link:
         chat_link = f"@{chat_link}"
-        save_config_property(chat_id, "Link", chat_link)
+        chat_data["Link"] = chat_link
+    save_config_properties(chat_id, chat_data)
     user_name = update_msg.from_user.full_name
     # If has an alias, just use the alias
     if update_msg.from_user.username is not None:
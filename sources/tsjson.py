@@ -10,9 +10,9 @@ Author:
 Creation date:
     20/07/2017
 Last modified date:
-    30/12/2022
+    15/10/2026
 Version:
-    1.3.0
+    1.4.0
 '''
 
 ###############################################################################
@@ -25,26 +25,114 @@ import logging
 from os import makedirs as os_makedirs
 from os import path as os_path
 from os import remove as os_remove
+from os import replace as os_replace
 from os import stat as os_stat
 
 # JSON Library
-from json import dump as json_dump
-from json import load as json_load
-
-# Collections Data Types Library
-from collections import OrderedDict
+from json import dumps as json_dumps
+from json import loads as json_loads
 
 # Threads and Multi-tasks Library
 from threading import Lock
 
+# Context Managers Library
+from contextlib import contextmanager
+
 # Error Traceback Library
 from traceback import format_exc
 
+###############################################################################
+### Optional Libraries
+
+# Fast JSON Library (listed in requirements, but use standard JSON
+# library if not available)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ###############################################################################
 ### Logger Setup
 
 logger = logging.getLogger(__name__)
 
+###############################################################################
+### Auxiliary Functions
+
+def json_encode(data, pretty=False):
+    '''
+    Serialize data to JSON UTF-8 encoded bytes, using orjson library if
+    it is available. Output is compact unless pretty indented format is
+    requested, which uses 2 spaces indentation with both libraries
+    (the only indentation supported by orjson).
+    '''
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json_dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json_dumps(
+            data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_decode(data):
+    '''
+    Parse JSON UTF-8 encoded bytes, using orjson library if it is
+    available.
+    '''
+    if orjson is not None:
+        return orjson.loads(data)
+    return json_loads(data)
+
+###############################################################################
+### Readers-Writer Lock Class
+
+class RWLock():
+    '''
+    Readers-Writer Lock class.
+    Multiple readers can hold the lock at the same time, while a writer
+    gets exclusive access to it.
+    '''
+
+    def __init__(self):
+        '''
+        Class Constructor.
+        It initializes the readers counter and the Mutex Lock elements.
+        '''
+        self._readers = 0
+        self._readers_lock = Lock()
+        self._write_lock = Lock()
+
+
+    @contextmanager
+    def read_lock(self):
+        '''
+        Shared lock for readers. First reader locks out the writers and
+        last reader releases it.
+        '''
+        with self._readers_lock:
+            self._readers += 1
+            if self._readers == 1:
+                self._write_lock.acquire()
+        try:
+            yield
+        finally:
+            with self._readers_lock:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._write_lock.release()
+
+
+    @contextmanager
+    def write_lock(self):
+        '''
+        Exclusive lock for writers.
+        '''
+        with self._write_lock:
+            yield
+
 ###############################################################################
 ### Thread-Safe JSON Class
 
@@ -53,36 +141,60 @@ class TSjson():
     Thread-Safe JSON files read/write class.
     '''
 
-    def __init__(self, file_name):
+    def __init__(self, file_name, pretty=False):
         '''
         Class Constructor.
-        It initializes the Mutex Lock element and get the file path.
+        It initializes the Readers-Writer Lock element, get the file path
+        and the JSON output format (compact or pretty indented), and
+        setup the cache of last read file content (a tuple of file stat
+        key and raw file bytes, so it can be replaced atomically by
+        concurrent readers).
         '''
-        self.lock = Lock()
+        self.lock = RWLock()
         self.file_name = file_name
+        self.pretty = pretty
+        self.tmp_file_name = f"{file_name}.tmp"
+        self.directory = os_path.dirname(file_name)
+        self._cache = None
 
 
     def read(self):
         '''
         Thread-Safe Read of JSON file.
-        It locks the Mutex access to the file, checks if the file exists
-        and is not empty, and then reads it content and try to parse as
-        JSON data and store it in an OrderedDict element. At the end,
+        It locks the shared read access to the file, checks if the file
+        exists and is not empty, and then reads it content and try to
+        parse as JSON data and store it in a dict element. At the end,
         the lock is released and the read and parsed JSON data is
         returned. If the process fails, it returns None.
+        The raw file content is cached and reused while the file
+        modification time and size doesn't change, so the file is not
+        read again; it is parsed on each call so callers always get new
+        data that they can modify.
         '''
         read = {}
         # Try to read the file
         try:
-            with self.lock:
+            with self.lock.read_lock():
                 # Check if file exists and is not empty
-                if not os_path.exists(self.file_name):
+                try:
+                    file_stat = os_stat(self.file_name)
+                except FileNotFoundError:
                     return {}
-                if not os_stat(self.file_name).st_size:
+                if not file_stat.st_size:
                     return {}
+                # Parse cached content if file has not been modified
+                cache_key = (file_stat.st_mtime_ns, file_stat.st_size)
+                cache = self._cache
+                if (cache is not None) and (cache[0] == cache_key):
+                    return json_decode(cache[1])
                 # Read the file and parse to JSON
-                with open(self.file_name, "r", encoding="utf-8") as file:
-                    read = json_load(file, object_pairs_hook=OrderedDict)
+                with open(self.file_name, "rb") as file:
+                    file_data = file.read()
+                # File could have been emptied after the stat
+                if not file_data:
+                    return {}
+                read = json_decode(file_data)
+                self._cache = (cache_key, file_data)
         except Exception:
             logger.error(format_exc())
             logger.error("Fail to read JSON file %s", self.file_name)
@@ -93,23 +205,51 @@ class TSjson():
     def write(self, data):
         '''
         Thread-Safe Write of JSON file.
-        It checks and creates all the needed directories to file path if
-        any does not exists. Then it locks the Mutex access to the file,
-        opens and overwrites the file with the provided JSON data.
+        It locks the exclusive write access to the file, writes the
+        provided JSON data to a temporary file and then atomically
+        replaces the original file with it, so a failure in the middle
+        of the write never leaves a corrupted file. If the file can't be
+        created due to missing directories, all of them are created.
+        The written JSON bytes are kept as the cached file content, so
+        next read doesn't need to read the file again, and they are only
+        parsed if a read asks for them.
         '''
         write_result_ok = False
-        if not data:
+        if data is None:
             return False
-        # Check for directory path and create all needed directories
-        directory = os_path.dirname(self.file_name)
-        if not os_path.exists(directory):
-            os_makedirs(directory)
         # Try to write the file
         try:
-            with self.lock:
-                with open(self.file_name, "w", encoding="utf-8") as file:
-                    json_dump(data, fp=file, ensure_ascii=False, indent=4)
+            with self.lock.write_lock():
+                self._cache = None
+                encoded_data = json_encode(data, self.pretty)
+                # Create all needed directories if file path doesn't exists
+                try:
+                    file = open(self.tmp_file_name, "wb")
+                except FileNotFoundError:
+                    if not self.directory:
+                        raise
+                    os_makedirs(self.directory, exist_ok=True)
+                    file = open(self.tmp_file_name, "wb")
+                try:
+                    with file:
+                        file.write(encoded_data)
+                    os_replace(self.tmp_file_name, self.file_name)
+                except Exception:
+                    os_remove(self.tmp_file_name)
+                    raise
                 write_result_ok = True
+                # Cache written content (file was written even if the
+                # stat fails, so just keep the cache empty in that case)
+                try:
+                    file_stat = os_stat(self.file_name)
+                except OSError:
+                    logger.warning(
+                            "Fail to stat written JSON file %s",
+                            self.file_name)
+                else:
+                    self._cache = (
+                            (file_stat.st_mtime_ns, file_stat.st_size),
+                            encoded_data)
         except Exception:
             logger.error(format_exc())
             logger.error("Fail to write JSON file %s", self.file_name)
@@ -122,11 +262,35 @@ class TSjson():
         '''
         remove_ok = False
         try:
-            with self.lock:
-                if os_path.exists(self.file_name):
+            with self.lock.write_lock():
+                self._cache = None
+                try:
                     os_remove(self.file_name)
+                except FileNotFoundError:
+                    pass
                 remove_ok = True
         except Exception:
             logger.error(format_exc())
             logger.error("Fail to remove JSON file %s", self.file_name)
         return remove_ok
+
+###############################################################################
+### TSjson Instances Registry
+
+# Shared TSjson instances by file path and the Mutex Lock to access them
+tsjson_instances = {}
+tsjson_instances_lock = Lock()
+
+
+def get_tsjson(file_name):
+    '''
+    Get the TSjson instance of a file path, creating it if it doesn't
+    exists yet, so all accessors of the same file share the same lock
+    and parsed data cache.
+    '''
+    with tsjson_instances_lock:
+        instance = tsjson_instances.get(file_name)
+        if instance is None:
+            instance = TSjson(file_name)
+            tsjson_instances[file_name] = instance
+        return instance